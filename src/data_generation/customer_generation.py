@@ -2,17 +2,85 @@
 This is the script for generating fake customer data
 """
 
-import random
+import os
+import csv
+import argparse
+import numpy as np
 import pandas as pd
-from faker import Faker
+from mimesis import Generic, Locale
+from multiprocessing import Pool
 from datetime import datetime, timedelta
 
-# intialize faker to create a fake data generator
-fake = Faker()
+# pyarrow's C++ csv writer is much faster than pandas' own writer,
+# fall back to pandas when pyarrow is not installed
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+
+# arrow-backed strings are stored in one contiguous buffer per column
+STRING_DTYPE = 'string[pyarrow]' if pa is not None else 'string'
 
 # setting a seed for consistency (same seed = same fake data every time)
-Faker.seed(42)
-random.seed(42)
+SEED = 42
+
+# intialize mimesis to create a fake data generator
+# (mimesis is much faster than faker for the same kinds of fields)
+fake = Generic(locale=Locale.EN, seed=SEED)
+rng = np.random.default_rng(SEED)
+
+CUSTOMER_SEGMENTS = ['VIP', 'Regular', 'New']
+
+# column order of the customers table
+CUSTOMER_COLUMNS = [
+    'customer_id', 'email', 'first_name', 'last_name', 'phone', 'address', 'city',
+    'state', 'zip_code', 'country', 'registration_date', 'customer_segement', 'lifetime_value'
+]
+
+# registration dates go back up to 2 years
+REGISTRATION_WINDOW_SECONDS = 2 * 365 * 24 * 60 * 60
+
+# columns with a small set of realistic values are drawn from pools
+# that are generated once at import instead of once per customer
+POOL_SIZE = 2000
+CITY_POOL = np.array([fake.address.city() for _ in range(POOL_SIZE)])
+STATE_POOL = np.unique([fake.address.state() for _ in range(POOL_SIZE)])
+EMAIL_DOMAINS = np.array(['gmail.com', 'yahoo.com', 'outlook.com', 'hotmail.com', 'icloud.com', 'aol.com'])
+
+# customer details are generated in fixed size chunks, each reseeded with
+# SEED + chunk index, so the output never depends on the worker count;
+# below the threshold a worker pool costs more than it saves
+CHUNK_SIZE = 1000
+PARALLEL_THRESHOLD = 50000
+
+# the columns filled in by generate_customer_details
+CUSTOMER_DETAIL_COLUMNS = ('first_name', 'last_name', 'address')
+
+def _choice(seq):
+    """
+    Picks one random element from a sequence with the shared generator.
+
+    Args:
+    - seq: list, tuple or numpy array to pick from
+
+    Returns:
+    - the picked element
+    """
+    return seq[rng.integers(0, len(seq))]
+
+def _uniform(low: float, high: float) -> float:
+    """
+    Draws one random float between low and high with the shared generator.
+
+    Args:
+    - low: lower bound
+    - high: upper bound
+
+    Returns:
+    - float between low and high
+    """
+    return float(rng.uniform(low, high))
 
 def generate_single_customer(customer_id: int):
     """
@@ -27,36 +95,143 @@ def generate_single_customer(customer_id: int):
 
     """
 
+    details = generate_customer_details(customer_id)
+
     # create dictionary for one customer
     customer = {
         'customer_id': customer_id, 
-        'email': fake.email(),
-        'first_name': fake.first_name(),
-        'last_name': fake.last_name(),
-        'phone': fake.phone_number(),
-        'address': fake.street_address(),
-        'city': fake.city(),
-        'state': fake.state(),
-        'zip_code': fake.zipcode(), 
+        'email': make_email(details['first_name'], details['last_name'], customer_id, _choice(EMAIL_DOMAINS)),
+        'first_name': details['first_name'],
+        'last_name': details['last_name'],
+        'phone': f"{rng.integers(200, 1000)}-{rng.integers(200, 1000)}-{rng.integers(1000, 10000)}",
+        'address': details['address'],
+        'city': str(_choice(CITY_POOL)),
+        'state': str(_choice(STATE_POOL)),
+        'zip_code': str(rng.integers(10000, 100000)), 
         'country': 'USA', 
-        'registration_date': fake.date_time_between(
-            start_date = '-2y',  # 2 years ago
-            end_date = 'now'     # up to now
+        # anywhere between 2 years ago and now
+        'registration_date': datetime.now() - timedelta(
+            seconds=int(rng.integers(REGISTRATION_WINDOW_SECONDS))
         ),
-        'customer_segement': random.choice(['VIP', 'Regular', 'New']),
-        'lifetime_value': round(random.uniform(100, 10000), 2) # random money value
+        'customer_segement': _choice(CUSTOMER_SEGMENTS),
+        'lifetime_value': round(_uniform(100, 10000), 2) # random money value
     }
 
     return customer
 
-def generate_customers(num_customers: int):
+def make_email(first_name: str, last_name: str, customer_id: int, domain: str) -> str:
     """
-    Generates multiple customers by calling 
-    the single customer generation function
-    multiple times based on the input number. 
+    Builds a customer's email address from their name. The
+    customer_id keeps every address unique.
+
+    Args:
+    - first_name: customer's first name
+    - last_name: customer's last name
+    - customer_id: a unique ID number for the customer
+    - domain: email domain (e.g. gmail.com)
+
+    Returns:
+    - String representing the email address
+    """
+    return f"{first_name.lower()}.{last_name.lower()}{customer_id}@{domain}"
+
+def generate_customer_details(customer_id: int):
+    """
+    Generates a single customer's name and street address, the
+    only columns that generate_customers does not draw for all
+    customers at once.
+
+    Args:
+    - customer_id: a unique ID number for the customer
+
+    Returns:
+    - dictionary containing customer generated details
+    """
+
+    # create dictionary for one customer's details
+    details = {
+        'first_name': fake.person.first_name(),
+        'last_name': fake.person.last_name(),
+        'address': fake.address.address()
+    }
+
+    return details
+
+def _worker_init(seed: int):
+    """
+    Runs once inside every worker process of the pool so that
+    each worker builds its own generator instead of sharing
+    the parent's copy.
+
+    Args:
+    - seed: base seed for the worker's generators
+    """
+    global fake, rng
+    fake = Generic(locale=Locale.EN, seed=seed)
+    rng = np.random.default_rng(seed)
+
+def _generate_customer_chunk(chunk: tuple) -> dict:
+    """
+    Generates the details of one chunk of customers inside a worker process.
+
+    The generators are reseeded with seed + chunk index, so the
+    output stays the same no matter which worker picks up the chunk.
+
+    Args:
+    - chunk: tuple of (chunk_index, customer_ids)
+
+    Returns:
+    - dictionary mapping each detail column to its list of values
+    """
+    chunk_index, customer_ids = chunk
+    fake.reseed(SEED + chunk_index)
+
+    # one list per column instead of one dictionary per customer
+    columns = dict()
+    for position, customer_id in enumerate(customer_ids):
+        for column, value in generate_customer_details(customer_id).items():
+            columns.setdefault(column, [None] * len(customer_ids))[position] = value
+
+    return columns
+
+def _generate_chunks_in_process(chunks: list) -> list:
+    """
+    Generates the chunks one after another in this process.
+
+    A fresh generator is swapped in the same way _worker_init does
+    for a worker and the module's own one is put back afterwards, so
+    the results match the pool's and the module's random stream is
+    left untouched.
+
+    Args:
+    - chunks: list of (chunk_index, customer_ids) tuples
+
+    Returns:
+    - list with the detail columns of each chunk
+    """
+    global fake, rng
+    saved_generators = (fake, rng)
+    _worker_init(SEED)
+    try:
+        return [_generate_customer_chunk(chunk) for chunk in chunks]
+    finally:
+        fake, rng = saved_generators
+
+def generate_customers(num_customers: int, num_workers: int = None):
+    """
+    Generates multiple customers based on the input number.
+
+    Only the names and street addresses need the fake data
+    generator; they are made with generate_customer_details in
+    fixed size chunks, in parallel across a pool of worker
+    processes for large runs. Every other column (email, phone,
+    city, state, zip code, dates, segment and lifetime value) is
+    drawn or built for all customers at once with numpy.
 
     Args:
     - num_customers: number of customers to generate
+    - num_workers: number of worker processes; by default a pool of CPU
+      count workers is only used from PARALLEL_THRESHOLD customers on
 
     Returns:
     - pandas DataFrame containing all the newly
@@ -65,19 +240,84 @@ def generate_customers(num_customers: int):
 
     print(f"Generating {num_customers} customers...")
 
-    # container for all customers
-    customers = list()
-    
-    # loop through the range of num_customers to generate each customer
-    for index in range(num_customers):
-        customer_id = index + 1 # ensure customer_id starts from 1
-        customer = generate_single_customer(customer_id)
-        customers.append(customer)
+    # container for all customers, one preallocated list per column,
+    # set up front so an empty run still has every column
+    columns = {column: [None] * num_customers for column in CUSTOMER_DETAIL_COLUMNS}
+
+    # ensure customer_id starts from 1
+    customer_ids = np.arange(1, num_customers + 1)
+
+    # fixed size chunks, so the same customers come out for any worker count
+    chunks = [
+        (chunk_index, customer_ids[start:start + CHUNK_SIZE])
+        for chunk_index, start in enumerate(range(0, num_customers, CHUNK_SIZE))
+    ]
+
+    # a pool only when asked for one or when there is enough work for it
+    if num_workers is None:
+        num_workers = (os.cpu_count() or 1) if num_customers >= PARALLEL_THRESHOLD else 1
+
+    if num_workers > 1:
+        # imap keeps the chunks in order so the customer_ids stay sorted
+        with Pool(processes=num_workers, initializer=_worker_init, initargs=(SEED,)) as pool:
+            chunk_results = list(pool.imap(_generate_customer_chunk, chunks))
+    else:
+        chunk_results = _generate_chunks_in_process(chunks)
+
+    for (_, ids), chunk_columns in zip(chunks, chunk_results):
+        start = ids[0] - 1
+        for column, values in chunk_columns.items():
+            columns[column][start:start + len(ids)] = values
 
     print("All customers have been generated")
 
-    # convert the list of customers into a pandas DataFrame
-    customers_df = pd.DataFrame(customers)
+    # pooled columns are drawn for all customers at once
+    cities = CITY_POOL[rng.integers(0, len(CITY_POOL), num_customers)]
+    state_codes = rng.integers(0, len(STATE_POOL), num_customers, dtype=np.int8)
+
+    # formatted columns are built from random digits without the generator,
+    # emails are first.last<customer_id>@domain like make_email
+    domains = EMAIL_DOMAINS[rng.integers(0, len(EMAIL_DOMAINS), num_customers)]
+    emails = np.char.lower(np.char.add(np.array(columns['first_name'], dtype=str), '.'))
+    emails = np.char.add(emails, np.char.lower(np.array(columns['last_name'], dtype=str)))
+    emails = np.char.add(emails, customer_ids.astype(str))
+    emails = np.char.add(np.char.add(emails, '@'), domains)
+    phones = [
+        f"{area}-{exchange}-{line}"
+        for area, exchange, line in zip(
+            rng.integers(200, 1000, num_customers).tolist(),
+            rng.integers(200, 1000, num_customers).tolist(),
+            rng.integers(1000, 10000, num_customers).tolist()
+        )
+    ]
+    zip_codes = rng.integers(10000, 100000, num_customers).astype(str)
+
+    # registration dates are drawn for all customers at once,
+    # anywhere between 2 years ago and now
+    now = np.datetime64(datetime.now(), 's')
+    offsets = rng.integers(0, REGISTRATION_WINDOW_SECONDS, size=num_customers, dtype=np.int64)
+
+    # build the pandas DataFrame column by column
+    customers_df = pd.DataFrame({
+        'customer_id': customer_ids,
+        'email': pd.array(emails, dtype=STRING_DTYPE),
+        'first_name': pd.array(columns['first_name'], dtype=STRING_DTYPE),
+        'last_name': pd.array(columns['last_name'], dtype=STRING_DTYPE),
+        'phone': phones,
+        'address': pd.array(columns['address'], dtype=STRING_DTYPE),
+        'city': pd.array(cities, dtype=STRING_DTYPE),
+        'state': pd.Categorical.from_codes(state_codes, categories=STATE_POOL),
+        'zip_code': zip_codes,
+        # every customer is in the USA, one shared category
+        'country': pd.Categorical.from_codes(np.zeros(num_customers, dtype=np.int8), categories=['USA']),
+        'registration_date': now - offsets.astype('timedelta64[s]'),
+        # segment and numeric columns are drawn for all customers at once
+        'customer_segement': pd.Categorical(
+            rng.choice(CUSTOMER_SEGMENTS, size=num_customers),
+            categories=CUSTOMER_SEGMENTS
+        ),
+        'lifetime_value': np.round(rng.uniform(100, 10000, num_customers), 2) # random money value
+    })
     print(f"Generated DataFrame with {len(customers_df)} customers")
 
     return customers_df
@@ -94,19 +334,57 @@ def save_to_csv(customers_df: pd.DataFrame, filename: str):
     - filename: name of the csv file to save the data to
 
     """
-    customers_df.to_csv(filename, index=False)
+    if pa is not None:
+        # bools as True/False like to_csv, pyarrow would write true/false
+        bool_columns = customers_df.select_dtypes(include='bool').columns
+        table = pa.Table.from_pandas(customers_df.astype({col: str for col in bool_columns}), preserve_index=False)
+        try:
+            # pyarrow always quotes its own header, so write it the way to_csv does
+            with open(filename, 'wb') as csv_file:
+                csv_file.write((','.join(customers_df.columns) + '\n').encode())
+                pacsv.write_csv(table, csv_file, write_options=pacsv.WriteOptions(
+                    include_header=False, batch_size=65536, quoting_style='none'))
+        except pa.ArrowInvalid:
+            # a value holds a comma, quote or newline, only to_csv quotes just those fields
+            customers_df.to_csv(filename, index=False)
+    else:
+        customers_df.to_csv(filename, index=False)
+    print(f"Customers data has been saved to {filename}")
+
+def generate_and_stream_csv(num_customers: int, filename: str):
+    """
+    Generates customers one at a time and writes them straight
+    to a CSV file, without building a DataFrame in between.
+
+    Use this when the CSV file is the only output needed, the
+    DataFrame route (generate_customers) is still needed for analysis.
+
+    Args:
+    - num_customers: number of customers to generate
+    - filename: name of the csv file to save the data to
+    """
+    print(f"Streaming {num_customers} customers to {filename}...")
+
+    with open(filename, 'w', newline='', buffering=1 << 20) as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=CUSTOMER_COLUMNS)
+        writer.writeheader()
+        for index in range(num_customers):
+            writer.writerow(generate_single_customer(index + 1))
+
     print(f"Customers data has been saved to {filename}")
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate fake customer data")
+    parser.add_argument(
+        '--stream', action='store_true',
+        help="write customers straight to the CSV file without building a DataFrame"
+    )
+    args = parser.parse_args()
+
     num_customers = 100
-    print(f"Starting customer data generation for {num_customers} customers...")
-    customers = generate_customers(num_customers)
-    # print(customers.head(10))
-    print(f"Successfully generated all of the customer data")
 
     # for now, script to save to csv
-    import os
     script_dir = os.path.dirname(os.path.abspath(__file__))
     # up two levels to project root
     project_root = os.path.join(script_dir, '..', '..')
@@ -116,5 +394,12 @@ if __name__ == "__main__":
 
     output_file = os.path.join(output_dir, 'customers.csv')
 
-    save_to_csv(customers, output_file)
+    print(f"Starting customer data generation for {num_customers} customers...")
+    if args.stream:
+        generate_and_stream_csv(num_customers, output_file)
+    else:
+        customers = generate_customers(num_customers)
+        # print(customers.head(10))
+        print(f"Successfully generated all of the customer data")
+        save_to_csv(customers, output_file)
     print("Customer data generation script has completed.")
\ No newline at end of file
@@ -7,15 +7,31 @@ and conduct various kinds of data analysis.
 """
 
 import os
-import random
+import sys
+import numpy as np
 import pandas as pd
-from faker import Faker
+from mimesis import Generic, Locale
+from multiprocessing import Pool
 from datetime import datetime, timedelta
 
-# initialize faker to get consistent fake data
-fake = Faker()
-Faker.seed(42)
-random.seed(42)
+# pyarrow's C++ csv writer is much faster than pandas' own writer,
+# fall back to pandas when pyarrow is not installed
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+
+# arrow-backed strings are stored in one contiguous buffer per column
+STRING_DTYPE = 'string[pyarrow]' if pa is not None else 'string'
+
+# initialize mimesis to get consistent fake data
+SEED = 42
+fake = Generic(locale=Locale.EN, seed=SEED)
+rng = np.random.default_rng(SEED)
+
+# product creation dates go back up to 1 year
+CREATED_WINDOW_SECONDS = 365 * 24 * 60 * 60
 
 categories = {
     'Electronics': ['Smartphones', 'Laptops', 'Tablets', 'Accessories', 'Cameras' ], 
@@ -26,6 +42,107 @@ categories = {
     'Beauty': ['Skincare', 'Makeup', 'Haircare', 'Fragrances', 'Tools'],
     'Food & Beverage': ['Snacks', 'Beverages', 'Organic', 'Gourmet', 'Pantry']
 }
+CATEGORY_NAMES = tuple(categories.keys())
+CATEGORY_ARRAY = np.array(CATEGORY_NAMES)
+# subcategory lookup table, one row per category in CATEGORY_NAMES order
+SUBCATEGORY_MATRIX = np.array([categories[category] for category in CATEGORY_NAMES])
+
+# generate price based on category as some categories are pricier
+price_ranges = {
+    'Electronics': (50, 2000), 
+    'Clothing': (15, 300), 
+    'Home & Garden': (20, 1500),
+    'Sports': (10, 500),
+    'Books': (5, 50), 
+    'Beauty': (10, 200), 
+    'Food & Beverage': (3, 100)
+}
+
+# price bounds per category, in the same order as CATEGORY_NAMES
+PRICE_MINS = np.array([price_ranges[category][0] for category in CATEGORY_NAMES], dtype=np.float64)
+PRICE_MAXS = np.array([price_ranges[category][1] for category in CATEGORY_NAMES], dtype=np.float64)
+
+# companies and colors are drawn from pools that are generated
+# once at import instead of once per product
+POOL_SIZE = 2000
+# companies are deduplicated so brands can share one categorical copy per name
+COMPANY_POOL = np.unique([fake.finance.company() for _ in range(5000)])
+COLOR_POOL = np.array([fake.text.color() for _ in range(POOL_SIZE)])
+# text is the most expensive field to generate and doesn't need to be unique
+DESCRIPTION_POOL_SIZE = 500
+DESCRIPTION_POOL = np.array([fake.text.text(quantity=2) for _ in range(DESCRIPTION_POOL_SIZE)], dtype=object)
+
+# product details are generated in fixed size chunks, each reseeded with
+# SEED + chunk index, so the output never depends on the worker count;
+# below the threshold a worker pool costs more than it saves
+CHUNK_SIZE = 1000
+PARALLEL_THRESHOLD = 50000
+
+# the columns filled in by generate_product_details
+PRODUCT_DETAIL_COLUMNS = ('product_name', 'image_url')
+
+# share of products at each popularity level, which drives stock levels
+POPULARITY_LEVELS = ['high', 'medium', 'low']
+POPULARITY_WEIGHTS = [0.2, 0.5, 0.3]
+
+# product name patterns per category, each pattern is only
+# evaluated when it is picked so unused patterns cost nothing
+name_patterns = {
+    'Electronics': [
+        lambda subcategory: f"{_choice(COMPANY_POOL)} {subcategory}",
+        lambda subcategory: f"Premium {subcategory} Pro",
+        lambda subcategory: f"{subcategory} {_choice(['X', 'Plus', 'Max', 'Ultra'])}"
+    ],
+    'Clothing': [
+        lambda subcategory: f"{_choice(COLOR_POOL)} {subcategory} {_choice(['Shirt', 'Pants', 'Jacket', 'Dress'])}",
+        lambda subcategory: f"Designer {subcategory} {_choice(['Collection', 'Style', 'Line'])}"
+    ],
+    'Home & Garden': [
+        lambda subcategory: f"Modern {subcategory} {_choice(['Set', 'Collection', 'Piece'])}",
+        lambda subcategory: f"{_choice(COLOR_POOL)} {subcategory}"
+    ],
+    'Sports': [
+        lambda subcategory: f"Pro {subcategory} {_choice(['Gear', 'Equipment', 'Kit'])}",
+        lambda subcategory: f"{subcategory} Champion"
+    ],
+    'Books': [
+        lambda subcategory: " ".join(fake.text.words(quantity=3)).title(),  # short book-like titles
+        lambda subcategory: f"The {fake.text.word().title()} {fake.text.word().title()}"
+    ],
+    'Beauty': [
+        lambda subcategory: f"{_choice(COMPANY_POOL)} {subcategory} {_choice(['Essentials', 'Collection', 'Kit'])}",
+        lambda subcategory: f"Luxury {subcategory}"
+    ],
+    'Food & Beverage': [
+        lambda subcategory: f"Organic {subcategory}",
+        lambda subcategory: f"{_choice(COMPANY_POOL)} {subcategory} Mix"
+    ]
+}
+
+def _choice(seq):
+    """
+    Picks one random element from a sequence with the shared generator.
+
+    Args:
+    - seq: list, tuple or numpy array to pick from
+
+    Returns:
+    - the picked element
+    """
+    return seq[rng.integers(0, len(seq))]
+
+def _uniform(low: float, high: float) -> float:
+    """
+    Draws one random float between low and high with the shared generator.
+
+    Args:
+    - low: lower bound
+    - high: upper bound
+
+    Returns:
+    - float between low and high
+    """
+    return float(rng.uniform(low, high))
 
 def generate_product_name(category:str, subcategory:str) -> str:
     """
@@ -39,41 +156,9 @@ def generate_product_name(category:str, subcategory:str) -> str:
     - String representing the product name
 
     """
-    name_patterns = {
-        'Electronics': [
-            f"{fake.company()} {subcategory}",
-            f"Premium {subcategory} Pro",
-            f"{subcategory} {random.choice(['X', 'Plus', 'Max', 'Ultra'])}"
-        ],
-        'Clothing': [
-            f"{fake.color_name()} {subcategory} {random.choice(['Shirt', 'Pants', 'Jacket', 'Dress'])}",
-            f"Designer {subcategory} {random.choice(['Collection', 'Style', 'Line'])}"
-        ],
-        'Home & Garden': [
-            f"Modern {subcategory} {random.choice(['Set', 'Collection', 'Piece'])}",
-            f"{fake.color_name()} {subcategory}"
-        ],
-        'Sports': [
-            f"Pro {subcategory} {random.choice(['Gear', 'Equipment', 'Kit'])}",
-            f"{subcategory} Champion"
-        ],
-        'Books': [
-            f"{fake.catch_phrase()}",  # generates book-like titles
-            f"The {fake.word().title()} {fake.word().title()}"
-        ],
-        'Beauty': [
-            f"{fake.company()} {subcategory} {random.choice(['Essentials', 'Collection', 'Kit'])}",
-            f"Luxury {subcategory}"
-        ],
-        'Food & Beverage': [
-            f"Organic {subcategory}",
-            f"{fake.company()} {subcategory} Mix"
-        ]
-    }
-
-    pattern = name_patterns.get(category, [f"{subcategory} Item"])
+    pattern = name_patterns.get(category, [lambda subcategory: f"{subcategory} Item"])
 
-    return random.choice(pattern)
+    return _choice(pattern)(subcategory)
 
 def generate_single_product(product_id: int) -> dict:
     """
@@ -87,52 +172,146 @@ def generate_single_product(product_id: int) -> dict:
     """
 
     # randomly select category and subcategory
-    category = random.choice(list(categories.keys()))
-    subcategory = random.choice(categories[category])
-
-    # generate price based on category as some categories are pricier
-    price_ranges = {
-        'Electronics': (50, 2000), 
-        'Clothing': (15, 300), 
-        'Home & Garden': (20, 1500),
-        'Sports': (10, 500),
-        'Books': (5, 50), 
-        'Beauty': (10, 200), 
-        'Food & Beverage': (3, 100)
-    }
+    category_idx = int(rng.integers(len(CATEGORY_NAMES)))
+    category = CATEGORY_NAMES[category_idx]
+    subcategory = str(_choice(SUBCATEGORY_MATRIX[category_idx]))
 
-    min_price, max_price = price_ranges.get(category, (10, 100))
-    price = round(random.uniform(min_price, max_price), 2)
-    cost_percentage = random.uniform(0.4, 0.8) # cost is 40% to 80% of price
+    min_price, max_price = float(PRICE_MINS[category_idx]), float(PRICE_MAXS[category_idx])
+    price = round(_uniform(min_price, max_price), 2)
+    cost_percentage = _uniform(0.4, 0.8) # cost is 40% to 80% of price
     cost = round(price * cost_percentage, 2)
 
+    details = generate_product_details(product_id, category, subcategory)
+
     product = {
         'product_id': product_id, 
-        'product_name': generate_product_name(category, subcategory), 
+        'product_name': details['product_name'], 
         'category': category,
         'subcategory': subcategory,
-        'brand': fake.company(),
+        'brand': str(_choice(COMPANY_POOL)),
         'price': price,
         'cost': cost,
         'profit_margin': round(((price - cost) / price) * 100, 2), 
-        'description': fake.text(max_nb_chars=200),
-        'image_url': fake.image_url(),
-        'weight_kg': round(random.uniform(.1, 20), 2),
-        'created_at': fake.date_time_between(
-            start_date = '-1y',
-            end_date = 'now'
+        'description': _choice(DESCRIPTION_POOL),
+        'image_url': details['image_url'],
+        'weight_kg': round(_uniform(.1, 20), 2),
+        # anywhere between 1 year ago and now
+        'created_at': datetime.now() - timedelta(
+            seconds=int(rng.integers(CREATED_WINDOW_SECONDS))
         )
     }
 
     return product
 
-def generate_products(num_products: int) -> pd.DataFrame:
+def generate_product_details(product_id: int, category: str, subcategory: str) -> dict:
+    """
+    Generates the text attributes of a product (name and
+    image) for an already chosen category and subcategory.
+
+    Args:
+    - product_id: unique identifier for the product
+    - category: main product category
+    - subcategory: specific product subcategory
+
+    Returns:
+    - dictionary containing the generated product details
+    """
+    return {
+        'product_name': generate_product_name(category, subcategory),
+        'image_url': f"https://picsum.photos/seed/{product_id}/640/480"
+    }
+
+def _worker_init(seed: int):
+    """
+    Runs once inside every worker process of the pool so that
+    each worker builds its own generator instead of sharing
+    the parent's copy.
+
+    Args:
+    - seed: base seed for the worker's generators
+    """
+    global fake, rng
+    fake = Generic(locale=Locale.EN, seed=seed)
+    rng = np.random.default_rng(seed)
+
+def _split_into_chunks(ids) -> list:
+    """
+    Splits a sequence of ids into indexed chunks of CHUNK_SIZE.
+    The chunks do not depend on the worker count, so neither
+    does the generated data.
+
+    Args:
+    - ids: sequence of ids to split
+
+    Returns:
+    - list of (chunk_index, ids) tuples
+    """
+    return [
+        (chunk_index, ids[start:start + CHUNK_SIZE])
+        for chunk_index, start in enumerate(range(0, len(ids), CHUNK_SIZE))
+    ]
+
+def _generate_product_chunk(chunk: tuple) -> dict:
+    """
+    Generates the details of one chunk of products inside a worker process.
+
+    The generators are reseeded with seed + chunk index, so the
+    output stays the same no matter which worker picks up the chunk.
+
+    Args:
+    - chunk: tuple of (chunk_index, list of (product_id, category, subcategory) tuples)
+
+    Returns:
+    - dictionary mapping each detail column to its list of values
+    """
+    chunk_index, products = chunk
+    global rng
+    fake.reseed(SEED + chunk_index)
+    rng = np.random.default_rng(SEED + chunk_index)
+
+    # one list per column instead of one dictionary per product
+    columns = dict()
+    for position, (product_id, category, subcategory) in enumerate(products):
+        for column, value in generate_product_details(product_id, category, subcategory).items():
+            columns.setdefault(column, [None] * len(products))[position] = value
+
+    return columns
+
+def _generate_chunks_in_process(chunks: list) -> list:
+    """
+    Generates the chunks one after another in this process.
+
+    Fresh generators are swapped in the same way _worker_init does
+    for a worker and the module's own ones are put back afterwards,
+    so the results match the pool's and the module's random streams
+    are left untouched.
+
+    Args:
+    - chunks: list of (chunk_index, products) tuples
+
+    Returns:
+    - list with the detail columns of each chunk
+    """
+    global fake, rng
+    saved_generators = (fake, rng)
+    _worker_init(SEED)
+    try:
+        return [_generate_product_chunk(chunk) for chunk in chunks]
+    finally:
+        fake, rng = saved_generators
+
+def generate_products(num_products: int, num_workers: int = None) -> pd.DataFrame:
     """
     Generates multiple products and then stores them in
     a pandas DataFrame
 
+    The text details are generated in fixed size chunks, in
+    parallel across a pool of worker processes for large runs.
+
     Args:
     - num_products: number of products to generate
+    - num_workers: number of worker processes; by default a pool of CPU
+      count workers is only used from PARALLEL_THRESHOLD products on
 
     Returns:
     - pandas DataFrame containing all the newly generated
@@ -140,17 +319,73 @@ def generate_products(num_products: int) -> pd.DataFrame:
     """
 
     print(f'Generating {num_products} products...')
-    products = list()
 
-    for i in range(num_products):
-        product_id = i + 1 # ensure product_id starts from 1
-        product = generate_single_product(product_id)
-        products.append(product)
+    # categories and numeric columns are drawn for all products at once
+    category_idx = rng.integers(0, len(CATEGORY_NAMES), num_products)
+    subcategory_idx = rng.integers(0, SUBCATEGORY_MATRIX.shape[1], num_products)
+    product_categories = CATEGORY_ARRAY[category_idx]
+    subcategories = SUBCATEGORY_MATRIX[category_idx, subcategory_idx]
+    prices = np.round(rng.uniform(PRICE_MINS[category_idx], PRICE_MAXS[category_idx]), 2)
+    cost_percentages = rng.uniform(0.4, 0.8, num_products) # cost is 40% to 80% of price
+    costs = np.round(prices * cost_percentages, 2)
+    profit_margins = np.round((prices - costs) / prices * 100, 2)
+    weights = np.round(rng.uniform(.1, 20, num_products), 2)
+    brand_codes = rng.integers(0, len(COMPANY_POOL), num_products, dtype=np.int32)
+    descriptions = DESCRIPTION_POOL[rng.integers(0, DESCRIPTION_POOL_SIZE, num_products)]
+
+    # creation dates anywhere between 1 year ago and now
+    now = np.datetime64(datetime.now(), 's')
+    offsets = rng.integers(0, CREATED_WINDOW_SECONDS, size=num_products, dtype=np.int64)
+    created_at = now - offsets.astype('timedelta64[s]')
+
+    # ensure product_id starts from 1
+    product_ids = np.arange(1, num_products + 1)
+    chunks = _split_into_chunks(
+        list(zip(product_ids.tolist(), product_categories.tolist(), subcategories.tolist()))
+    )
+
+    # a pool only when asked for one or when there is enough work for it
+    if num_workers is None:
+        num_workers = (os.cpu_count() or 1) if num_products >= PARALLEL_THRESHOLD else 1
+
+    # the text details still need the generators, one product at a time
+    if num_workers > 1:
+        # imap keeps the chunks in order so the product_ids stay sorted
+        with Pool(processes=num_workers, initializer=_worker_init, initargs=(SEED,)) as pool:
+            chunk_results = list(pool.imap(_generate_product_chunk, chunks))
+    else:
+        chunk_results = _generate_chunks_in_process(chunks)
+
+    # collected into one preallocated list per column, set up front
+    # so an empty run still has every column
+    details = {column: [None] * num_products for column in PRODUCT_DETAIL_COLUMNS}
+    for (_, products), chunk_details in zip(chunks, chunk_results):
+        start = products[0][0] - 1
+        for column, values in chunk_details.items():
+            details[column][start:start + len(products)] = values
 
     print("All products have been generated.")
 
-    # convert the list of products into a pandas DataFrame
-    products_df = pd.DataFrame(products)
+    # build the pandas DataFrame column by column
+    products_df = pd.DataFrame({
+        'product_id': product_ids,
+        'product_name': pd.array(details['product_name'], dtype=STRING_DTYPE),
+        'category': pd.Categorical.from_codes(category_idx, categories=CATEGORY_NAMES),
+        'subcategory': pd.Categorical(subcategories),
+        'brand': pd.Categorical.from_codes(brand_codes, categories=COMPANY_POOL),
+        'price': prices,
+        'cost': costs,
+        'profit_margin': profit_margins,
+        'description': pd.array(descriptions, dtype=STRING_DTYPE),
+        'image_url': pd.array(details['image_url'], dtype=STRING_DTYPE),
+        'weight_kg': weights,
+        'created_at': created_at
+    })
+
+    # building from separate column arrays puts the numeric columns in one
+    # column-major block, which keeps the column-wise reductions in
+    # analyze_product_data fast
+    assert products_df[['price', 'cost']].values.flags.f_contiguous
 
     return products_df
 
@@ -170,16 +405,16 @@ def generate_inventory_for_product(product_id, num_warehouses=3) -> list:
     for warehouse_id in range(1, num_warehouses + 1):
         # different warehouses might have different stock levels
         # some products are more popular and tbus have higher stock
-        popularity = random.choices(['high', 'medium', 'low'])
+        popularity = rng.choice(POPULARITY_LEVELS, p=POPULARITY_WEIGHTS)
         if popularity == 'high':
-            quantity = random.randint(100, 500)
-            reorder_level = random.randint(50, 100)
+            quantity = int(rng.integers(100, 501))
+            reorder_level = int(rng.integers(50, 101))
         elif popularity =='medium':
-            quantity = random.randint(20, 100)
-            reorder_level = random.randint(20, 50)
+            quantity = int(rng.integers(20, 101))
+            reorder_level = int(rng.integers(20, 51))
         else:
-            quantity = random.randint(0, 20)
-            reorder_level = random.randint(10, 20)
+            quantity = int(rng.integers(0, 21))
+            reorder_level = int(rng.integers(10, 21))
 
         inventory = {
             'product_id': product_id, 
@@ -198,6 +433,9 @@ def generate_inventory(products_df: pd.DataFrame, num_warehouses=3) -> pd.DataFr
     """
     Generates inventory records for all products in the provided DataFrame.
 
+    Every (product, warehouse) record is drawn at once with NumPy
+    instead of one generate_inventory_for_product call per product.
+
     Args:
     - products_df: pandas DataFrame containing product data
     - num_warehouses: number of warehouses to generate inventory for
@@ -206,15 +444,46 @@ def generate_inventory(products_df: pd.DataFrame, num_warehouses=3) -> pd.DataFr
     - pandas DataFrame containing all inventory records
     """
     print(f"Generating inventory for {len(products_df)} products across {num_warehouses} warehouses...")
-    all_inventory = list()
 
-    # for each product, create inventory records in each warehouse
-    for product_id in products_df['product_id']:
-        inventory_records = generate_inventory_for_product(product_id, num_warehouses)
-        all_inventory.extend(inventory_records)
+    # for each product, create inventory records in each warehouse,
+    # filled into preallocated fixed-dtype arrays
+    num_records = len(products_df) * num_warehouses
+    product_ids = np.empty(num_records, dtype=np.int32)
+    warehouse_ids = np.empty(num_records, dtype=np.int16)
+    quantity = np.empty(num_records, dtype=np.int32)
+    reorder_level = np.empty(num_records, dtype=np.int32)
+    last_updated = np.full(num_records, np.datetime64(datetime.now(), 's'))
+
+    product_ids[:] = np.repeat(products_df['product_id'].to_numpy(), num_warehouses)
+    warehouse_ids[:] = np.tile(np.arange(1, num_warehouses + 1), len(products_df))
+
+    # some products are more popular and thus have higher stock
+    popularity = rng.choice(POPULARITY_LEVELS, size=num_records, p=POPULARITY_WEIGHTS)
+    is_high = popularity == 'high'
+    is_medium = popularity == 'medium'
+
+    quantity[:] = np.where(
+        is_high, rng.integers(100, 501, num_records),
+        np.where(is_medium, rng.integers(20, 101, num_records), rng.integers(0, 21, num_records))
+    )
+    reorder_level[:] = np.where(
+        is_high, rng.integers(50, 101, num_records),
+        np.where(is_medium, rng.integers(20, 51, num_records), rng.integers(10, 21, num_records))
+    )
 
     print("All inventory records have been generated.")
-    inventory_df = pd.DataFrame(all_inventory)
+    inventory_df = pd.DataFrame({
+        'product_id': product_ids,
+        'warehouse_id': warehouse_ids,
+        # every record shares one copy of each warehouse name
+        'warehouse_name': pd.Categorical.from_codes(
+            warehouse_ids - 1,
+            categories=[f"Warehouse {warehouse_id}" for warehouse_id in range(1, num_warehouses + 1)]
+        ),
+        'quantity': quantity,
+        'last_updated': last_updated,
+        'needs_reorder': reorder_level > quantity
+    })
 
     return inventory_df
 
@@ -230,42 +499,66 @@ def save_to_csv(dataframe: pd.DataFrame, filename: str):
     - filename: name of the csv file to save the data to
 
     """
-    dataframe.to_csv(filename, index=False)
+    if pa is not None:
+        # bools as True/False like to_csv, pyarrow would write true/false
+        bool_columns = dataframe.select_dtypes(include='bool').columns
+        table = pa.Table.from_pandas(dataframe.astype({col: str for col in bool_columns}), preserve_index=False)
+        try:
+            # pyarrow always quotes its own header, so write it the way to_csv does
+            with open(filename, 'wb') as csv_file:
+                csv_file.write((','.join(dataframe.columns) + '\n').encode())
+                pacsv.write_csv(table, csv_file, write_options=pacsv.WriteOptions(
+                    include_header=False, batch_size=65536, quoting_style='none'))
+        except pa.ArrowInvalid:
+            # a value holds a comma, quote or newline, only to_csv quotes just those fields
+            dataframe.to_csv(filename, index=False)
+    else:
+        dataframe.to_csv(filename, index=False)
     print(f"Products and inventory data has been saved to {filename}") 
 
 def analyze_product_data(products_df: pd.DataFrame, inventory_df: pd.DataFrame):
     """
     Performs basic analysis on the generated product and inventory data
     """
-    print("\n" + "=" * 60)
-    print("DATA ANALYSIS")
-    print("=" * 60)
-    
-    # Product analysis
-    print("\n PRODUCT CATALOG:")
-    print(f"  Total products: {len(products_df)}")
-    print(f"\n  Products by category:")
-    for category, count in products_df['category'].value_counts().items():
-        print(f"    {category}: {count}")
-    
-    print(f"\n  Price statistics:")
-    print(f"    Min price: ${products_df['price'].min():.2f}")
-    print(f"    Max price: ${products_df['price'].max():.2f}")
-    print(f"    Avg price: ${products_df['price'].mean():.2f}")
-    print(f"    Median price: ${products_df['price'].median():.2f}")
-    
-    # inventory analysis
-    print("\n INVENTORY:")
-    print(f"  Total inventory records: {len(inventory_df)}")
-    print(f"  Total units in stock: {inventory_df['quantity'].sum():,}")
-    print(f"  Products with low stock: {inventory_df['needs_reorder'].sum()}")
-    
-    # data quality checks
-    print("\n DATA QUALITY CHECKS:")
-    print(f"  All products have inventory: {len(products_df) * 3 == len(inventory_df)}")
-    print(f"  No negative prices: {(products_df['price'] > 0).all()}")
-    print(f"  Price > Cost: {(products_df['price'] > products_df['cost']).all()}")
-    print(f"  No duplicate product IDs: {products_df['product_id'].is_unique}\n")
+    n_products = len(products_df)
+    # one pass over the price column for all of the statistics
+    price_stats = products_df['price'].agg(['min', 'max', 'mean', 'median'])
+    category_counts = "\n".join(
+        f"    {category}: {count}"
+        for category, count in products_df['category'].value_counts().items()
+    )
+
+    # the whole report is built first and written out at once
+    report = f"""
+{"=" * 60}
+DATA ANALYSIS
+{"=" * 60}
+
+ PRODUCT CATALOG:
+  Total products: {n_products}
+
+  Products by category:
+{category_counts}
+
+  Price statistics:
+    Min price: ${price_stats['min']:.2f}
+    Max price: ${price_stats['max']:.2f}
+    Avg price: ${price_stats['mean']:.2f}
+    Median price: ${price_stats['median']:.2f}
+
+ INVENTORY:
+  Total inventory records: {len(inventory_df)}
+  Total units in stock: {inventory_df['quantity'].sum():,}
+  Products with low stock: {inventory_df['needs_reorder'].sum()}
+
+ DATA QUALITY CHECKS:
+  All products have inventory: {n_products * 3 == len(inventory_df)}
+  No negative prices: {(products_df['price'] > 0).all()}
+  Price > Cost: {(products_df['price'] > products_df['cost']).all()}
+  No duplicate product IDs: {products_df['product_id'].is_unique}
+
+"""
+    sys.stdout.write(report)
 
 
 
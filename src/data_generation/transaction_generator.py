@@ -7,13 +7,71 @@ customer purchace transactions and history.
 """
 
 import os
-import uuid
-import random
+import bisect
+import itertools
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 
-# seeds for data consistency
-random.seed(42)
+# pyarrow is optional, parquet output falls back to CSV without it
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+# arrow backed strings when pyarrow is installed
+STRING_DTYPE = 'string[pyarrow]' if pyarrow is not None else 'string'
+
+# seed for data consistency, every random draw comes from rng
+SEED = 42
+rng = np.random.default_rng(SEED)
+
+# discount percentages, repeated values make "no discount" more likely
+DISCOUNT_TIERS = np.array([0, 0, 0, 5, 10, 15, 20], dtype=np.int8)
+TAX_PERCENT = 8
+
+PAYMENT_METHODS = ['credit_card', 'debit_card', 'paypal', 'apple_pay', 'google_pay']
+PAYMENT_WEIGHTS = [0.4, 0.3, 0.15, 0.05, 0.05]
+
+STATUS_OPTIONS = ['completed', 'pending', 'failed']
+STATUS_WEIGHTS = [0.92, 0.05, 0.03]
+
+# cumulative weights for single draws and normalized probabilities for
+# bulk draws, both built once (payment weights sum to 0.95)
+PAYMENT_CUM_WEIGHTS = list(itertools.accumulate(PAYMENT_WEIGHTS))
+STATUS_CUM_WEIGHTS = list(itertools.accumulate(STATUS_WEIGHTS))
+PAYMENT_PROBABILITIES = np.divide(PAYMENT_WEIGHTS, sum(PAYMENT_WEIGHTS))
+STATUS_PROBABILITIES = np.divide(STATUS_WEIGHTS, sum(STATUS_WEIGHTS))
+
+def weighted_choice(options: list, cum_weights: list):
+    """
+    Picks one option using precomputed cumulative weights
+
+    Args:
+    - options: list of options to pick from
+    - cum_weights: running totals of the option weights
+
+    Returns:
+    - the selected option
+    """
+    return options[bisect.bisect(cum_weights, rng.random() * cum_weights[-1])]
+
+def read_table(data_dir: str, name: str) -> pd.DataFrame:
+    """
+    Reads a saved table, preferring its parquet file over the CSV one
+
+    Args:
+    - data_dir: directory where the data files are stored
+    - name: file name of the table without its extension
+
+    Returns:
+    - pandas DataFrame with the table's data
+    """
+    parquet_file = os.path.join(data_dir, f"{name}.parquet")
+    if pyarrow is not None and os.path.exists(parquet_file):
+        return pd.read_parquet(parquet_file, engine='pyarrow')
+
+    return pd.read_csv(os.path.join(data_dir, f"{name}.csv"))
 
 def load_seed_data(data_dir: str):
     """
@@ -28,12 +86,9 @@ def load_seed_data(data_dir: str):
     """
     print(f"Loading seed data from {data_dir}...")
 
-    customers_file = os.path.join(data_dir, "customers.csv")
-    products_file = os.path.join(data_dir, "products.csv")
-
     # load data and convert to DataFrames
-    customers_df = pd.read_csv(customers_file)
-    products_df = pd.read_csv(products_file)
+    customers_df = read_table(data_dir, "customers")
+    products_df = read_table(data_dir, "products")
 
     print(f"Loaded {len(customers_df)} customers and {len(products_df)} products")
 
@@ -41,13 +96,28 @@ def load_seed_data(data_dir: str):
 
 def generate_transaction_id():
     """
-    Generates a unique transaction ID using UUID4
+    Generates a unique transaction ID from 4 bytes of the seeded rng
 
     Returns:
     - str: unique transaction ID (TXN-xxxxxx)
 
     """
-    return f"TXN-{str(uuid.uuid4())[:8]}"
+    return f"TXN-{rng.bytes(4).hex()}"
+
+def generate_transaction_ids(num_ids: int) -> np.ndarray:
+    """
+    Generates many transaction IDs from a single draw of the seeded rng
+
+    Args:
+    - num_ids: number of transaction IDs to generate
+
+    Returns:
+    - array of transaction IDs (TXN-xxxxxxxx)
+    """
+    # one rng.bytes draw, cut into 4 byte windows of 8 hex characters each
+    raw = rng.bytes(4 * num_ids).hex()
+
+    return np.array([f"TXN-{raw[i:i + 8]}" for i in range(0, 8 * num_ids, 8)])
 
 def select_random_customer(customers_df: pd.DataFrame, customer_segment_weights=None):
     """
@@ -59,7 +129,7 @@ def select_random_customer(customers_df: pd.DataFrame, customer_segment_weights=
     - customer_segment_weights: optional dictionary of weights by segment
 
     Returns:
-    - pandas Series representing the selected customer
+    - dictionary representing the selected customer
     """
     # if customer_segment_weights is None:
     #     customer_segment_weights = {
@@ -79,9 +149,12 @@ def select_random_customer(customers_df: pd.DataFrame, customer_segment_weights=
         # TODO: implement customer segment based selection
         pass
     
-    return customers_df.sample(n=1).iloc[0]
+    # a single integer draw instead of DataFrame.sample
+    index = rng.integers(len(customers_df))
+
+    return customers_df.iloc[index].to_dict()
 
-def select_shopping_cart(products_df: pd.DataFrame, min_items=1, max_items=10):
+def select_shopping_cart(products_df: pd.DataFrame, min_items=1, max_items=10) -> np.ndarray:
     """
     Generates a shopping cart by randomly selecting products
 
@@ -91,54 +164,141 @@ def select_shopping_cart(products_df: pd.DataFrame, min_items=1, max_items=10):
     - max_items: maximum number of items in the cart
 
     Returns:
-    - DataFrame representing the shopping cart items
+    - array of row positions into products_df for the cart items
     """
-    # the amount of items in the cart
-    num_items = random.randint(min_items, max_items)
+    # the amount of items in the cart, never more than there are products
+    num_items = min(rng.integers(min_items, max_items + 1), len(products_df))
 
     # selects random products for the cart
     # cannot have the same products twice in the cart
-    cart = products_df.sample(n=num_items)
+    return rng.choice(len(products_df), size=num_items, replace=False)
 
-    return cart
+def to_cents(amounts) -> np.ndarray:
+    """
+    Converts dollar amounts to whole cents
 
-def generate_transaction_items(transaction_id: int, cart_products: pd.DataFrame) -> list:
+    Args:
+    - amounts: dollar amounts (array or list of floats)
+
+    Returns:
+    - int64 array of cents
     """
-    Generate line items for a transaction from the shopping cart
+    return np.rint(np.multiply(amounts, 100)).astype(np.int64)
+
+def to_dollars(cents: np.ndarray) -> np.ndarray:
+    """
+    Converts whole cents back to dollar amounts
 
     Args:
-    - transaction_id: the parent transaction ID
-    - cart_products: DataFrame of products in the shopping cart
+    - cents: int64 array of cents
 
     Returns:
-    - List of dictionaries, one per item
+    - float64 array of dollars
+    """
+    return cents / 100
+
+def percent_of(cents: np.ndarray, percentages) -> np.ndarray:
+    """
+    Takes a percentage of amounts in cents, rounding half cents up
+
+    Args:
+    - cents: int64 array of cents
+    - percentages: whole number percentages (scalar or array)
+
+    Returns:
+    - int64 array of cents
     """
-    items = list()
+    return (cents * percentages + 50) // 100
 
-    for _, product in cart_products.iterrows():
-        quantity = random.randint(1, 5)
-        unit_price = float(product['price'])
+def price_line_items(unit_price_cents: np.ndarray):
+    """
+    Draws quantities and discounts for a batch of line items
 
-        # applying random discount
-        discount_percentage = random.choice([0, 0, 0, 5, 10, 15, 20])
-        discount_amount = round(unit_price * quantity * (discount_percentage / 100 ), 2)
+    All money is kept as int64 cents, so there is no float rounding
+    until the amounts are converted back to dollars.
 
-        subtotal = round((unit_price * quantity) - discount_amount, 2)
+    Args:
+    - unit_price_cents: array with the unit price of each line item in cents
 
-        item = {
+    Returns:
+    - Tuple of (quantities, discount_cents, subtotal_cents) arrays
+    """
+    num_items = len(unit_price_cents)
+
+    # line item amounts, with a random discount applied
+    quantities = rng.integers(1, 6, size=num_items)
+    discount_percentages = rng.choice(DISCOUNT_TIERS, size=num_items)
+    gross_cents = unit_price_cents * quantities
+    discount_cents = percent_of(gross_cents, discount_percentages)
+    subtotal_cents = gross_cents - discount_cents
+
+    return quantities, discount_cents, subtotal_cents
+
+def generate_transaction_items(transaction_id: int, products_df: pd.DataFrame, cart: np.ndarray) -> list:
+    """
+    Generate line items for a transaction from the shopping cart
+
+    Args:
+    - transaction_id: the parent transaction ID
+    - products_df: pandas DataFrame containing product data
+    - cart: row positions of the products in the shopping cart
+
+    Returns:
+    - List of dictionaries, one per item
+    """
+    unit_price_cents = to_cents(products_df['price'].to_numpy(dtype=np.float64)[cart])
+    quantities, discount_cents, subtotal_cents = price_line_items(unit_price_cents)
+
+    # the whole cart is priced at once, dictionaries are only built at the end
+    return [
+        {
             'transaction_id': transaction_id,
-            'product_id': product['product_id'], 
-            'product_name': product['product_name'],
-            'category': product['category'], 
+            'product_id': product_id,
+            'product_name': product_name,
+            'category': category,
             'quantity': quantity,
             'unit_price': unit_price,
             'discount_amount': discount_amount,
             'subtotal': subtotal
         }
+        for product_id, product_name, category, quantity, unit_price, discount_amount, subtotal in zip(
+            products_df['product_id'].to_numpy()[cart].tolist(),
+            products_df['product_name'].to_numpy()[cart].tolist(),
+            products_df['category'].to_numpy()[cart].tolist(),
+            quantities.tolist(),
+            to_dollars(unit_price_cents).tolist(),
+            to_dollars(discount_cents).tolist(),
+            to_dollars(subtotal_cents).tolist()
+        )
+    ]
+
+def calculate_cart_totals(item_subtotal_cents: np.ndarray, discount_cents: np.ndarray, offsets: np.ndarray) -> dict:
+    """
+    Calculate the totals for many transactions at once
+
+    Args:
+    - item_subtotal_cents: flat array of line item subtotals in cents
+    - discount_cents: flat array of line item discounts in cents
+    - offsets: position where each transaction's items start
+
+    Returns:
+    - dictionary of arrays with one total per transaction, in cents
+    """
+    # transaction totals are the sums over each cart's line items
+    subtotals = np.add.reduceat(item_subtotal_cents, offsets)
+    total_discounts = np.add.reduceat(discount_cents, offsets)
 
-        items.append(item)
+    # calculate tax with tax rate of 8%
+    tax_amounts = percent_of(subtotals, TAX_PERCENT)
+    total_amounts = subtotals + tax_amounts
 
-    return items
+    return {
+        'subtotal': subtotals,
+        'tax_amount': tax_amounts,
+        'total_amount': total_amounts,
+        'total_discount': total_discounts,
+        'total_items': np.diff(offsets, append=len(item_subtotal_cents))
+    }
 
 def calculate_transaction_totals(items: list) -> dict:
     """
@@ -151,22 +311,19 @@ def calculate_transaction_totals(items: list) -> dict:
     - dictionary of transaction totals
 
     """
-    subtotal = sum(item['subtotal'] for item in items)
-
-    # calculate tax with tax rate of 8%
-    tax_rate = 0.08
-    tax_amount = round(subtotal * tax_rate, 2)
-
-    total_amount = round(subtotal + tax_amount, 2)
-
-    total_discount = sum(item['discount_amount'] for item in items)
+    totals = calculate_cart_totals(
+        to_cents([item['subtotal'] for item in items]),
+        to_cents([item['discount_amount'] for item in items]),
+        np.zeros(1, dtype=np.intp)
+    )
 
+    # a single transaction, so unwrap the one-element arrays
     return {
-        'subtotal': subtotal,
-        'tax_amount': tax_amount,
-        'total_amount': total_amount,
-        'total_discount': total_discount,
-        'total_items': len(items)
+        'subtotal': to_dollars(totals['subtotal'])[0].item(),
+        'tax_amount': to_dollars(totals['tax_amount'])[0].item(),
+        'total_amount': to_dollars(totals['total_amount'])[0].item(),
+        'total_discount': to_dollars(totals['total_discount'])[0].item(),
+        'total_items': totals['total_items'][0].item()
     }
 
 def generate_single_transaction(customers_df: pd.DataFrame, products_df: pd.DataFrame, transaction_date=None):
@@ -186,21 +343,16 @@ def generate_single_transaction(customers_df: pd.DataFrame, products_df: pd.Data
     transaction_id = generate_transaction_id()
     customer = select_random_customer(customers_df)
     cart = select_shopping_cart(products_df, min_items=1, max_items=10)
-    items = generate_transaction_items(transaction_id, cart)
+    items = generate_transaction_items(transaction_id, products_df, cart)
     totals = calculate_transaction_totals(items)
 
     if transaction_date is None:
         # randomly generate a date within the last 90 days
-        days_ago = random.randint(0, 90)
+        days_ago = int(rng.integers(0, 91))
         transaction_date = datetime.now() - timedelta(days=days_ago)
 
-    payment_methods = ['credit_card', 'debit_card', 'paypal', 'apple_pay', 'google_pay']
-    payment_weights = [0.4, 0.3, 0.15, 0.05, 0.05]
-    payment_method = random.choices(payment_methods, weights=payment_weights)[0]
-
-    status_options = ['completed', 'pending', 'failed']
-    status_weights = [0.92, 0.05, 0.03]
-    status = random.choices(status_options, weights=status_weights)[0]
+    payment_method = weighted_choice(PAYMENT_METHODS, PAYMENT_CUM_WEIGHTS)
+    status = weighted_choice(STATUS_OPTIONS, STATUS_CUM_WEIGHTS)
 
     # building the transaction dictionary
     transaction = {
@@ -221,10 +373,46 @@ def generate_single_transaction(customers_df: pd.DataFrame, products_df: pd.Data
 
     return transaction, items
 
+def draw_cart_products(item_transactions: np.ndarray, num_products: int) -> np.ndarray:
+    """
+    Draws a random product for every line item so that the
+    same product never appears twice in one shopping cart.
+
+    Products are drawn with replacement first, then any product
+    repeated inside a cart is redrawn until none are left.
+
+    Args:
+    - item_transactions: the transaction index of every line item
+    - num_products: number of products to draw from
+
+    Returns:
+    - numpy array with the product index of every line item
+    """
+    product_idx = rng.integers(0, num_products, size=len(item_transactions))
+
+    while True:
+        # sorting by (transaction, product) puts repeats next to each other
+        order = np.lexsort((product_idx, item_transactions))
+        sorted_transactions = item_transactions[order]
+        sorted_products = product_idx[order]
+        repeated = (
+            (sorted_transactions[1:] == sorted_transactions[:-1])
+            & (sorted_products[1:] == sorted_products[:-1])
+        )
+        if not repeated.any():
+            return product_idx
+
+        redraw = order[1:][repeated]
+        product_idx[redraw] = rng.integers(0, num_products, size=len(redraw))
+
 def generate_transactions(customers_df: pd.DataFrame, products_df: pd.DataFrame, num_transactions=500):
     """
     Generate multiple transactions for customers and products
 
+    Every random value (customers, carts, quantities, discounts,
+    dates, payment and status) is drawn for all transactions at
+    once with NumPy instead of one transaction at a time.
+
     Args:
     - customers_df: DataFrame of customers
     - products_df: DataFrame of products
@@ -235,17 +423,77 @@ def generate_transactions(customers_df: pd.DataFrame, products_df: pd.DataFrame,
     """
     print(f"Generating {num_transactions} transactions...")
 
-    all_transactions = list()
-    all_items = list()
-
-    for i in range(num_transactions):
-        transaction, items = generate_single_transaction(customers_df, products_df)
-        all_transactions.append(transaction)
-        all_items.extend(items)
-
-    # converting to DataFrames
-    transactions_df = pd.DataFrame(all_transactions)
-    items_df = pd.DataFrame(all_items)
+    # carts cannot hold more products than there are products
+    max_items = min(10, len(products_df))
+
+    # the amount of items in each cart, and where each cart
+    # starts in the flat list of line items
+    cart_sizes = rng.integers(1, max_items + 1, size=num_transactions)
+    offsets = np.concatenate([[0], np.cumsum(cart_sizes)])
+    item_transactions = np.repeat(np.arange(num_transactions), cart_sizes)
+
+    # random customer for each transaction, random products for each cart
+    customer_idx = rng.integers(0, len(customers_df), size=num_transactions)
+    product_idx = draw_cart_products(item_transactions, len(products_df))
+
+    # line item amounts, with a random discount applied
+    unit_price_cents = to_cents(products_df['price'].to_numpy(dtype=np.float64))[product_idx]
+    quantities, discount_cents, item_subtotal_cents = price_line_items(unit_price_cents)
+
+    totals = calculate_cart_totals(item_subtotal_cents, discount_cents, offsets[:-1])
+
+    # randomly generate a date within the last 90 days
+    days_ago = rng.integers(0, 91, size=num_transactions)
+    now = pd.Timestamp.now().floor('s')
+    transaction_dates = now - pd.to_timedelta(days_ago, unit='D')
+
+    # low cardinality columns are stored as categorical codes
+    payment_methods = pd.Categorical.from_codes(
+        rng.choice(len(PAYMENT_METHODS), size=num_transactions, p=PAYMENT_PROBABILITIES),
+        categories=PAYMENT_METHODS
+    )
+    statuses = pd.Categorical.from_codes(
+        rng.choice(len(STATUS_OPTIONS), size=num_transactions, p=STATUS_PROBABILITIES),
+        categories=STATUS_OPTIONS
+    )
+
+    transaction_ids = generate_transaction_ids(num_transactions)
+
+    # only the customer columns that are needed, indexed once per transaction
+    customer_ids = customers_df['customer_id'].to_numpy()[customer_idx]
+    customer_emails = customers_df['email'].to_numpy()[customer_idx]
+    # "address, city, state zip" joined column-wise for all transactions
+    shipping_addresses = np.char.add(customers_df['address'].to_numpy()[customer_idx].astype(str), ', ')
+    shipping_addresses = np.char.add(shipping_addresses, customers_df['city'].to_numpy()[customer_idx].astype(str))
+    shipping_addresses = np.char.add(np.char.add(shipping_addresses, ', '), customers_df['state'].to_numpy()[customer_idx].astype(str))
+    shipping_addresses = np.char.add(np.char.add(shipping_addresses, ' '), customers_df['zip_code'].to_numpy()[customer_idx].astype(str))
+
+    # building the DataFrames from the column arrays, with explicit dtypes
+    transactions_df = pd.DataFrame({
+        'transaction_id': pd.array(transaction_ids, dtype=STRING_DTYPE),
+        'customer_id': customer_ids.astype(np.int32),
+        'customer_email': pd.array(customer_emails, dtype=STRING_DTYPE),
+        'transaction_date': transaction_dates,
+        'total_amount': to_dollars(totals['total_amount']),
+        'subtotal': to_dollars(totals['subtotal']),
+        'tax_amount': to_dollars(totals['tax_amount']),
+        'total_discount': to_dollars(totals['total_discount']),
+        'payment_method': payment_methods,
+        'status': statuses,
+        'num_items': cart_sizes.astype(np.int8),
+        'shipping_address': pd.array(shipping_addresses, dtype=STRING_DTYPE),
+        'created_at': now
+    })
+    items_df = pd.DataFrame({
+        'transaction_id': pd.array(transaction_ids[item_transactions], dtype=STRING_DTYPE),
+        'product_id': products_df['product_id'].to_numpy(dtype=np.int32)[product_idx],
+        'product_name': pd.array(products_df['product_name'].to_numpy()[product_idx], dtype=STRING_DTYPE),
+        'category': pd.Categorical(products_df['category'].to_numpy()[product_idx]),
+        'quantity': quantities.astype(np.int8),
+        'unit_price': to_dollars(unit_price_cents),
+        'discount_amount': to_dollars(discount_cents),
+        'subtotal': to_dollars(item_subtotal_cents)
+    })
 
     print(f"Generated {len(transactions_df)} transactions and {len(items_df)} items")
 
@@ -259,27 +507,30 @@ def analyze_transaction_data(transactions_df, items_df):
     print("TRANSACTION DATA ANALYSIS")
     print("=" * 70)
     
+    num_transactions = len(transactions_df)
+    num_items = len(items_df)
+
     # transaction analysis
     print("\n TRANSACTIONS:")
-    print(f"  Total transactions: {len(transactions_df)}")
+    print(f"  Total transactions: {num_transactions}")
     print(f"  Total revenue: ${transactions_df['total_amount'].sum():,.2f}")
     print(f"  Average order value: ${transactions_df['total_amount'].mean():.2f}")
     print(f"  Median order value: ${transactions_df['total_amount'].median():.2f}")
     
     print(f"\n  Transaction status breakdown:")
-    for status, count in transactions_df['status'].value_counts().items():
-        pct = (count / len(transactions_df)) * 100
+    status_counts = transactions_df['status'].value_counts()
+    for status, count, pct in zip(status_counts.index, status_counts, status_counts / num_transactions * 100):
         print(f"    {status}: {count} ({pct:.1f}%)")
     
     print(f"\n  Payment method breakdown:")
-    for method, count in transactions_df['payment_method'].value_counts().items():
-        pct = (count / len(transactions_df)) * 100
+    method_counts = transactions_df['payment_method'].value_counts()
+    for method, count, pct in zip(method_counts.index, method_counts, method_counts / num_transactions * 100):
         print(f"    {method}: {count} ({pct:.1f}%)")
     
     # items analysis
     print("\n TRANSACTION ITEMS:")
-    print(f"  Total items sold: {len(items_df)}")
-    print(f"  Average items per transaction: {len(items_df) / len(transactions_df):.2f}")
+    print(f"  Total items sold: {num_items}")
+    print(f"  Average items per transaction: {num_items / num_transactions:.2f}")
     print(f"  Total revenue from items: ${items_df['subtotal'].sum():,.2f}")
     print(f"  Total discounts given: ${items_df['discount_amount'].sum():,.2f}")
     
@@ -290,7 +541,7 @@ def analyze_transaction_data(transactions_df, items_df):
         print(f"    {prod_name}: {qty} units")
     
     print(f"\n  Top 5 categories by revenue:")
-    category_revenue = items_df.groupby('category')['subtotal'].sum()
+    category_revenue = items_df.groupby('category', observed=True)['subtotal'].sum()
     category_revenue = category_revenue.sort_values(ascending=False).head()
     for category, revenue in category_revenue.items():
         print(f"    {category}: ${revenue:,.2f}")
@@ -304,17 +555,18 @@ def analyze_transaction_data(transactions_df, items_df):
     
     # data quality checks
     print("\n DATA QUALITY CHECKS:")
-    print(f"  All transactions have items: {len(transactions_df) <= len(items_df)}")
+    print(f"  All transactions have items: {num_transactions <= num_items}")
     print(f"  No negative amounts: {(transactions_df['total_amount'] >= 0).all()}")
     print(f"  Unique transaction IDs: {transactions_df['transaction_id'].is_unique}")
-    print(f"  Items link to transactions: {items_df['transaction_id'].isin(transactions_df['transaction_id']).all()}")
+    items_linked = np.isin(items_df['transaction_id'].to_numpy(), transactions_df['transaction_id'].to_numpy()).all()
+    print(f"  Items link to transactions: {items_linked}")
     
     # Calculate some business metrics
     print("\n BUSINESS METRICS:")
     completed_txns = transactions_df[transactions_df['status'] == 'completed']
     if len(completed_txns) > 0:
         print(f"  Completed revenue: ${completed_txns['total_amount'].sum():,.2f}")
-        conversion_rate = (len(completed_txns) / len(transactions_df)) * 100
+        conversion_rate = (len(completed_txns) / num_transactions) * 100
         print(f"  Conversion rate: {conversion_rate:.1f}%")
         avg_discount_per_order = transactions_df['total_discount'].mean()
         print(f"  Average discount per order: ${avg_discount_per_order:.2f}")
@@ -331,6 +583,19 @@ def save_to_csv(dataframe, filename):
     dataframe.to_csv(filename, index=False)
     print(f" Saved to {filename}")
 
+def save_to_parquet(dataframe, filename):
+    """
+    Save DataFrame to a zstd compressed Parquet file, which keeps
+    the column dtypes (categoricals included) and is much faster to
+    write and read back than CSV
+    
+    Args:
+        dataframe: pandas DataFrame to save
+        filename: Full path to output file
+    """
+    dataframe.to_parquet(filename, engine='pyarrow', compression='zstd', index=False)
+    print(f" Saved to {filename}")
+
 if __name__ == "__main__": 
     print("=" * 70)
     print("E-COMMERCE TRANSACTION GENERATOR")
@@ -361,15 +626,16 @@ if __name__ == "__main__":
     item_cols = ["transaction_id", "product_name", "quantity", "unit_price", "discount_amount", "subtotal"]
     print(items_df[item_cols].head(10))
 
-    # save to CSV
+    # save to Parquet, or to CSV when pyarrow is not installed
     print("\n" + "=" * 70)
     print("SAVING DATA TO FILES")
     print("=" * 70)
 
-    transactions_file = os.path.join(data_dir, "transactions.csv")
-    items_file = os.path.join(data_dir, "transaction_items.csv")
-
-    save_to_csv(transactions_df, transactions_file)
-    save_to_csv(items_df, items_file)
+    if pyarrow is not None:
+        save_to_parquet(transactions_df, os.path.join(data_dir, "transactions.parquet"))
+        save_to_parquet(items_df, os.path.join(data_dir, "transaction_items.parquet"))
+    else:
+        save_to_csv(transactions_df, os.path.join(data_dir, "transactions.csv"))
+        save_to_csv(items_df, os.path.join(data_dir, "transaction_items.csv"))
 
     print("Files have been saved successsfully insde the data directory")
\ No newline at end of file
@@ -3,11 +3,19 @@ Supabase Database Connection Utilities
 This provides functions to connect to PostgreSQL database on Supabase
 """
 
+import io
 import os
+import argparse
+import json
+import sys
+import atexit
 import psycopg2
+from psycopg2 import sql
+from psycopg2.pool import ThreadedConnectionPool
+from psycopg2.extras import execute_values
 from dotenv import load_dotenv
 from contextlib import contextmanager
-from psycopg2.extras import execute_batch
+from functools import lru_cache
 
 # databae configuration
 load_dotenv()
@@ -19,6 +27,9 @@ DB_CONFIG = {
     "password": os.getenv("DB_PASSWORD"),
 }
 
+# separator line used by the printed reports
+_BANNER = "=" * 70
+
 def test_config():
     print(DB_CONFIG['host'])
     print(DB_CONFIG['port'])
@@ -40,18 +51,47 @@ def get_connection():
         print(f"Error connecting to the database: {e}")
         print("Double check the connection details in the DB_CONFIG")
 
+# shared connection pool, created on first use so importing
+# this module does not open any connections
+_pool = None
+
+def get_pool():
+    """
+    Create (once) and return the shared connection pool
+
+    Returns:
+    - psycopg2 ThreadedConnectionPool object
+    """
+    global _pool
+    if _pool is None:
+        _pool = ThreadedConnectionPool(1, 10, **DB_CONFIG)
+    return _pool
+
+@atexit.register
+def close_pool():
+    """
+    Close every connection in the shared pool, if it was created
+
+    This runs automatically when the interpreter exits.
+    """
+    global _pool
+    if _pool is not None:
+        _pool.closeall()
+        _pool = None
+
 @contextmanager
 def get_db_cursor():
     """
     Context manager for database cursor
-    This automatically commits and closes connection
+    This automatically commits and returns the connection to the pool
 
     Usage:
         with get_db_cursor() as cursor:
             cursor.execute("SELECT * FROM customers)
             results = cursor.fetchall()
     """
-    conn = get_connection()
+    pool = get_pool()
+    conn = pool.getconn()
     cursor = conn.cursor()
 
     try:
@@ -59,145 +99,394 @@ def get_db_cursor():
         conn.commit()
     except Exception as e:
         conn.rollback()
-        print("Database error: {e}")
+        print(f"Database error: {e}")
         raise e
     finally:
         cursor.close()
-        conn.close()
+        pool.putconn(conn)
+
+def get_table_counts(cursor, table_names: list, exact: bool = False) -> dict:
+    """
+    Get row counts for several tables in a single query
+
+    By default the counts are approximate and come from the statistics
+    collector (pg_stat_user_tables), which avoids scanning the tables.
+    With exact=True the tables are counted with COUNT(*), joined with
+    UNION ALL so it is still one statement and one round trip.
+
+    Args:
+    - cursor: open database cursor
+    - table_names: names of the tables to count
+    - exact: whether to count every row instead of using statistics
+
+    Returns:
+    - dictionary mapping table names to row counts
+    """
+    if not table_names:
+        return dict()
+
+    if exact:
+        cursor.execute(sql.SQL(" UNION ALL ").join(
+            sql.SQL("SELECT {}, COUNT(*) FROM {}").format(sql.Literal(table_name), sql.Identifier(table_name))
+            for table_name in table_names
+        ))
+    else:
+        cursor.execute("""
+            SELECT relname, n_live_tup
+            FROM pg_stat_user_tables
+            WHERE schemaname = 'public'
+            AND relname = ANY(%s);
+        """, (list(table_names),))
+
+    return dict(cursor.fetchall())
+
+def count_rows(table_name: str):
+    """
+    Count the rows of a table exactly with COUNT(*)
+
+    Args:
+    - table_name: name of the table
+
+    Returns:
+    - number of rows in the table, or None when there is no
+      public table with that name
+    """
+    # checked against the cached schema like sample_and_count does,
+    # so a missing table is not sent to COUNT(*) at all
+    if table_name not in get_schema():
+        return None
+
+    with get_db_cursor() as cursor:
+        return get_table_counts(cursor, [table_name], exact=True)[table_name]
+
+def count_rows_approx(table_name: str):
+    """
+    Estimate the rows of a table from pg_stat_user_tables,
+    without scanning it; good enough for health checks
+
+    Args:
+    - table_name: name of the table
+
+    Returns:
+    - approximate number of rows in the table, or None when there
+      is no public table with that name
+    """
+    with get_db_cursor() as cursor:
+        return get_table_counts(cursor, [table_name]).get(table_name)
 
-def test_connection():
+def test_connection(sample_table: str = None, sample_limit: int = 3):
     """
     Test database connection and show table list
+
+    Args:
+    - sample_table: optional table to also show a few rows of, fetched
+      together with its estimated row count in one query
+    - sample_limit: number of sample rows to show
     """
-    print("=" * 70)
-    print("TESTING SUPABASE DATABASE CONNECTION")
-    print("=" * 70)
+    # the report is collected line by line and written out at once
+    report = [_BANNER, "TESTING SUPABASE DATABASE CONNECTION", _BANNER]
     
     try:
         conn = get_connection()
         cursor = conn.cursor()
         
-        # get PostgreSQL version
-        cursor.execute("SELECT version();")
-        version = cursor.fetchone()[0]
-        print(f"\nSuccessfully connected to Supabase!")
-        print(f"  PostgreSQL Version: {version.split(',')[0]}")
-        
-        # get database name and host
-        cursor.execute("SELECT current_database(), inet_server_addr(), inet_server_port();")
-        db_name, host, port = cursor.fetchone()
-        print(f"  Database: {db_name}")
-        print(f"  Host: {host}:{port}")
+        # get PostgreSQL version, database name, host and size in one round trip
+        cursor.execute("""
+            SELECT
+                version(),
+                current_database(),
+                inet_server_addr(),
+                inet_server_port(),
+                pg_size_pretty(pg_database_size(current_database()));
+        """)
+        version, db_name, host, port, db_size = cursor.fetchone()
+        report.append(f"\nSuccessfully connected to Supabase!")
+        report.append(f"  PostgreSQL Version: {version.split(',')[0]}")
+        report.append(f"  Database: {db_name}")
+        report.append(f"  Host: {host}:{port}")
         
-        # list all tables
+        # list all tables and views together
         cursor.execute("""
-            SELECT table_name 
+            SELECT table_name, table_type
             FROM information_schema.tables 
             WHERE table_schema = 'public' 
-            AND table_type = 'BASE TABLE'
+            AND table_type IN ('BASE TABLE', 'VIEW')
             ORDER BY table_name;
         """)
         
-        tables = cursor.fetchall()
-        print(f"\nFound {len(tables)} tables:")
-        for table in tables:
-            print(f"  - {table[0]}")
+        relations = cursor.fetchall()
+        tables = [name for name, table_type in relations if table_type == 'BASE TABLE']
+        views = [name for name, table_type in relations if table_type == 'VIEW']
+        report.append(f"\nFound {len(tables)} tables:")
+        report.extend(f"  - {table}" for table in tables)
         
-        # count rows in each table
-        print(f"\nCurrent row counts:")
-        for table in tables:
-            table_name = table[0]
-            cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
-            count = cursor.fetchone()[0]
-            print(f"  - {table_name}: {count:,} rows")
+        # approximate row counts for all tables in one round trip
+        counts = get_table_counts(cursor, tables)
+        report.append(f"\nCurrent row counts (approximate):")
+        report.extend(f"  - {table}: {counts.get(table, 0):,} rows" for table in tables)
         
-        # list views
-        cursor.execute("""
-            SELECT table_name 
-            FROM information_schema.views 
-            WHERE table_schema = 'public'
-            ORDER BY table_name;
-        """)
-        
-        views = cursor.fetchall()
         if views:
-            print(f"\nFound {len(views)} views:")
-            for view in views:
-                print(f"  - {view[0]}")
+            report.append(f"\nFound {len(views)} views:")
+            report.extend(f"  - {view}" for view in views)
         
-        # check database size
-        cursor.execute("""
-            SELECT pg_size_pretty(pg_database_size(current_database())) as size;
-        """)
-        db_size = cursor.fetchone()[0]
-        print(f"\nDatabase size: {db_size}")
+        # the sample and its estimated count come back in one round trip
+        if sample_table:
+            try:
+                sample_count, sample_rows = sample_and_count(sample_table, limit=sample_limit)
+                report.append(f"\nSample of {sample_table} (~{sample_count:,} rows):")
+                report.append(json.dumps(sample_rows, indent=2, default=str))
+            except ValueError as e:
+                report.append(f"\nSample skipped: {e}")
+        
+        report.append(f"\nDatabase size: {db_size}")
         
         cursor.close()
         conn.close()
         
-        print("\n" + "=" * 70)
-        print("CONNECTION TEST SUCCESSFUL!")
-        print("=" * 70)
+        report.extend(["\n" + _BANNER, "CONNECTION TEST SUCCESSFUL!", _BANNER])
+        sys.stdout.write("\n".join(report) + "\n")
         
         return True
         
     except psycopg2.Error as e:
-        print("\n" + "=" * 70)
-        print("CONNECTION TEST FAILED")
-        print("=" * 70)
-        print(f"\nError: {e}")
-        print("\nTroubleshooting:")
-        print("1. Check your DB_CONFIG settings")
-        print("2. Verify password is correct")
-        print("3. Check host address (should end with .supabase.co)")
-        print("4. Ensure project is not paused (Supabase pauses inactive projects)")
-        print("5. Check internet connection")
+        report.extend(["\n" + _BANNER, "CONNECTION TEST FAILED", _BANNER])
+        report.append(f"\nError: {e}")
+        report.append("\nTroubleshooting:")
+        report.append("1. Check your DB_CONFIG settings")
+        report.append("2. Verify password is correct")
+        report.append("3. Check host address (should end with .supabase.co)")
+        report.append("4. Ensure project is not paused (Supabase pauses inactive projects)")
+        report.append("5. Check internet connection")
+        sys.stdout.write("\n".join(report) + "\n")
         
         return False
     
-def get_table_info(table_name:str):
+@lru_cache(maxsize=None)
+def get_schema() -> dict:
     """
-    Get detailed information about a table
+    Load the columns of every public table, once per process
 
-    Args:
-    - table_name: name of the table
+    A single information_schema query is made on the first call and
+    its result is reused afterwards, so it does not see schema
+    changes made later (call get_schema.cache_clear() to reload).
 
+    Returns:
+    - dictionary mapping table names to lists of
+      (column_name, data_type, max_length, nullable, default) tuples
     """
     with get_db_cursor() as cursor:
-        # getting column information
-        cursor.execute(f"""
+        cursor.execute("""
             SELECT
+                table_name,
                 column_name,
                 data_type,
                 character_maximum_length,
                 is_nullable,
                 column_default
             FROM information_schema.columns
-            WHERE table_name = '{table_name}'
-            ORDER BY ordinal_position;         
+            WHERE table_schema = 'public'
+            ORDER BY table_name, ordinal_position;
         """)
+        rows = cursor.fetchall()
 
-        columns = cursor.fetchall()
-        print(f"\nTable: {table_name}")
-        print("-"*70)
-        print(f"{'Column':<25} {'Type':<20} {'Nullable':<10} {'Default':<15}")
-        print("-" * 70)
-        
-        for col in columns:
-            col_name, data_type, max_length, nullable, default = col
-            type_str = f"{data_type}({max_length})" if max_length else data_type
-            default_str = str(default)[:15] if default else ''
-            print(f"{col_name:<25} {type_str:<20} {nullable:<10} {default_str:<15}")
+    schema = dict()
+    for table_name, *column in rows:
+        schema.setdefault(table_name, []).append(tuple(column))
+
+    return schema
+
+def get_table_info(table_name:str):
+    """
+    Get detailed information about a table
+
+    Args:
+    - table_name: name of the table
+
+    """
+    # getting column information
+    columns = get_schema().get(table_name, [])
+    info = [
+        f"\nTable: {table_name}",
+        "-" * 70,
+        f"{'Column':<25} {'Type':<20} {'Nullable':<10} {'Default':<15}",
+        "-" * 70
+    ]
+    
+    # one formatted line per column, written out together
+    info.extend(
+        f"{col_name:<25} {f'{data_type}({max_length})' if max_length else data_type:<20} "
+        f"{nullable:<10} {str(default)[:15] if default else '':<15}"
+        for col_name, data_type, max_length, nullable, default in columns
+    )
+    sys.stdout.write("\n".join(info) + "\n")
+
+def sample_and_count(table_name: str, limit: int = 5, columns: list = None):
+    """
+    Fetch a few rows of a table together with its estimated row count
+
+    The estimate from pg_stat_user_tables is selected as an extra
+    column of the sample query, so both come back in one round trip.
+    Only the requested columns are selected and the limit is applied
+    by the database.
+
+    Args:
+    - table_name: name of the table
+    - limit: maximum number of rows to fetch
+    - columns: optional list of column names to fetch, defaults to all
+      columns of the table as recorded in the schema cache
+
+    Returns:
+    - Tuple of (estimated_count, list of row dictionaries)
+
+    Raises:
+    - ValueError: if the table is not in the cached schema
+    """
+    schema = get_schema()
+    if table_name not in schema:
+        raise ValueError(
+            f"Table '{table_name}' not found in the public schema "
+            "(if it was just created, call get_schema.cache_clear() first)"
+        )
+
+    # the column names come from the cached schema, not from the result
+    if not columns:
+        columns = [column[0] for column in schema[table_name]]
+
+    estimated_count = sql.SQL("""(
+        SELECT n_live_tup
+        FROM pg_stat_user_tables
+        WHERE schemaname = 'public'
+        AND relname = %s
+    )""")
+    select_list = sql.SQL(", ").join([estimated_count] + [sql.Identifier(column) for column in columns])
+
+    with get_db_cursor() as cursor:
+        cursor.execute(
+            sql.SQL("SELECT {} FROM {} LIMIT %s").format(select_list, sql.Identifier(table_name)),
+            (table_name, limit)
+        )
+        rows = cursor.fetchall()
+
+    # an empty table returns no rows to carry the estimate
+    count = (rows[0][0] or 0) if rows else 0
+
+    return count, [dict(zip(columns, row[1:])) for row in rows]
+
+def show_table_sample(table_name: str, limit: int = 5, columns: list = None):
+    """
+    Print a few rows of a table along with its estimated row count
+
+    Args:
+    - table_name: name of the table
+    - limit: maximum number of rows to show
+    - columns: optional list of column names to show, defaults to all
+    """
+    count, records = sample_and_count(table_name, limit=limit, columns=columns)
+
+    # json.dumps renders every row in C, default=str covers dates and decimals
+    sys.stdout.write(
+        f"\n{table_name} (~{count:,} rows, showing {len(records)}):\n"
+        f"{json.dumps(records, indent=2, default=str)}\n"
+    )
+
+def copy_dataframe(table_name: str, dataframe):
+    """
+    Bulk load a DataFrame into a table with PostgreSQL COPY
+
+    The rows are streamed as CSV in one COPY command instead of
+    being sent as INSERT statements, which skips the per-row
+    parsing and planning on the server.
+
+    Args:
+    - table_name: name of the table to load into
+    - dataframe: pandas DataFrame whose columns match the table's columns
+
+    Returns:
+    - number of rows copied
+    """
+    buffer = io.StringIO()
+    dataframe.to_csv(buffer, index=False, header=False)
+    buffer.seek(0)
+
+    copy_query = sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT csv)").format(
+        sql.Identifier(table_name),
+        sql.SQL(", ").join(sql.Identifier(column) for column in dataframe.columns)
+    )
+
+    with get_db_cursor() as cursor:
+        cursor.copy_expert(copy_query, buffer)
+        print(f"Copied {cursor.rowcount:,} rows into {table_name}")
+        return cursor.rowcount
+
+def insert_rows(table_name: str, rows: list, page_size: int = 1000):
+    """
+    Insert a list of rows in batches over one pooled connection
+
+    Each batch of page_size rows is sent as a single multi-row
+    INSERT, rather than one statement per row. For very large
+    loads copy_dataframe is faster still.
+
+    Args:
+    - table_name: name of the table to insert into
+    - rows: list of dictionaries, all with the same keys as the table columns
+    - page_size: number of rows sent per INSERT statement
+
+    Returns:
+    - number of rows inserted
+    """
+    if not rows:
+        return 0
+
+    columns = list(rows[0].keys())
+    insert_query = sql.SQL("INSERT INTO {} ({}) VALUES %s").format(
+        sql.Identifier(table_name),
+        sql.SQL(", ").join(sql.Identifier(column) for column in columns)
+    )
+    values = [tuple(row[column] for column in columns) for row in rows]
+
+    with get_db_cursor() as cursor:
+        execute_values(cursor, insert_query, values, page_size=page_size)
+
+    print(f"Inserted {len(values):,} rows into {table_name}")
+    return len(values)
 
 if __name__ == "__main__":
-    # testing db_config
-    test_config()
-
-    # testing connection
-    # success = test_connection()
-    # if success:
-    #     print()
-    #     print("=" * 70)
-    #     print("BONUS: TABLE SCHEMA DETAILS")
-    #     print("=" * 70)
-    #     get_table_info("customers")
+    parser = argparse.ArgumentParser(description="Supabase database connection utilities")
+    subparsers = parser.add_subparsers(dest='command')
+
+    subparsers.add_parser('config', help="print the database configuration (default)")
+    test_parser = subparsers.add_parser('test-connection', help="run the full connection test")
+    test_parser.add_argument('--sample', metavar='TABLE', help="also show a few rows of this table")
+
+    info_parser = subparsers.add_parser('info', help="show the columns of a table")
+    info_parser.add_argument('table')
+
+    sample_parser = subparsers.add_parser('sample', help="show a few rows of a table")
+    sample_parser.add_argument('table')
+    sample_parser.add_argument('--limit', type=int, default=5, help="number of rows to show")
+
+    count_parser = subparsers.add_parser('count', help="count the rows of a table")
+    count_parser.add_argument('table')
+    count_parser.add_argument('--exact', action='store_true', help="use COUNT(*) instead of statistics")
+
+    args = parser.parse_args()
+
+    # only the requested check talks to the database
+    if args.command == 'test-connection':
+        test_connection(sample_table=args.sample)
+    elif args.command == 'info':
+        get_table_info(args.table)
+    elif args.command == 'sample':
+        try:
+            show_table_sample(args.table, limit=args.limit)
+        except ValueError as e:
+            print(e)
+    elif args.command == 'count':
+        count = count_rows(args.table) if args.exact else count_rows_approx(args.table)
+        if count is None:
+            print(f"{args.table}: no such table in the public schema")
+        else:
+            print(f"{args.table}: {count:,} rows")
+    else:
+        # testing db_config
+        test_config()